@@ -20,17 +20,22 @@ Environment Variables Required:
     X_API_KEY, X_API_SECRET, X_ACCESS_TOKEN, X_ACCESS_SECRET
 """
 
-import urllib.request
-import urllib.parse
 import json
-import ssl
+import re
 import os
 import time
 import logging
+from collections import OrderedDict, deque
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
-from typing import Optional, List, Dict, Tuple
-import tempfile
+from io import BytesIO
+from typing import Optional, List, Dict, Set, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Optional: Twitter API
 try:
@@ -40,13 +45,24 @@ except ImportError:
     TWEEPY_AVAILABLE = False
     print("⚠️  tweepy not installed. Run: pip install tweepy")
 
+# Optional: streaming JSON parser (falls back to a full parse)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Optional: fast JSON (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
-# SSL bypass for API calls
-ssl._create_default_https_context = ssl._create_unverified_context
-
 # Paths
 SCRIPT_DIR = Path(__file__).parent
 STATE_FILE = SCRIPT_DIR / "bot_state.json"
@@ -55,22 +71,80 @@ LOG_FILE = SCRIPT_DIR / "bot.log"
 # API
 GAMMA_API_BASE = "https://gamma-api.polymarket.com"
 
+# HTTP connection pool (shared by Gamma API + image CDN requests)
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 10
+HTTP_RETRIES = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+)
+
+# (connect, read) timeouts in seconds - fail fast on a dead host,
+# but allow slow response bodies
+GAMMA_TIMEOUT = (5, 30)
+IMAGE_TIMEOUT = (5, 15)
+
+# In-memory cache of downloaded event images, keyed by URL
+IMAGE_CACHE_SIZE = 64  # Max images kept
+IMAGE_CACHE_MAX_BYTES = 5 * 1024 * 1024  # Larger images are not cached
+
+# Images at least this large use the chunked INIT/APPEND/FINALIZE upload
+CHUNKED_UPLOAD_MIN_BYTES = 1024 * 1024  # 1 MB
+
+# Twitter posting quota, enforced locally with a token bucket so we never
+# send a tweet that is certain to be rejected with 429
+TWEET_QUOTA = 50  # Tweets allowed per window
+TWEET_QUOTA_WINDOW_SECONDS = 24 * 60 * 60
+RATE_LIMIT_FALLBACK_SECONDS = 15 * 60  # Pause when a 429 has no reset header
+
 # Polling settings
 POLL_INTERVAL_SECONDS = 600  # 10 minutes
 LOOKBACK_MINUTES = 30  # Look for events created in last 30 minutes (buffer for restarts)
 
+# State
+MAX_TWEETED_IDS = 500  # How many tweeted event IDs to remember
+
 # Filters
 MIN_VOLUME = 0  # Minimum total volume to tweet ($0 = no filter)
 
 # Sports series slugs to filter out
-SPORTS_SERIES = [
+SPORTS_SERIES = frozenset([
     "nba", "nfl", "nhl", "mlb", "mls", "wnba",
     "nba-2026", "nfl-2025", "nhl-2026", "cfb", "cfb-2025",
     "premier-league", "premier-league-2025", "bundesliga", "bundesliga-2025",
     "la-liga", "serie-a", "ligue-1", "champions-league", "europa-league",
     "ucl-2025", "uel-2025",
+])
+
+# Substrings that mark a series slug as sports
+SPORTS_SERIES_PATTERNS = ["nba", "nfl", "nhl", "mlb", "soccer", "football", "basketball"]
+
+# Substrings that mark an event title as sports
+SPORTS_TITLE_PATTERNS = [" vs ", " vs. ", "o/u ", "spread:", "moneyline", "over/under"]
+
+# Common crypto price prediction spam patterns
+CRYPTO_SPAM_PATTERNS = [
+    "up or down",
+    "bitcoin above", "bitcoin price", "bitcoin hit",
+    "ethereum above", "ethereum price", "ethereum hit",
+    "solana above", "solana price", "solana hit",
+    "xrp above", "xrp price", "xrp hit",
+    "doge above", "doge price", "doge hit",
+    "btc above", "btc price", "eth above", "eth price",
+    "sol above", "sol price",
 ]
 
+
+def _compile_patterns(patterns: List[str]) -> re.Pattern:
+    """Compile literal substrings into a single alternation regex."""
+    return re.compile("|".join(re.escape(p) for p in patterns))
+
+
+_SPORTS_SERIES_RE = _compile_patterns(SPORTS_SERIES_PATTERNS)
+_SPORTS_TITLE_RE = _compile_patterns(SPORTS_TITLE_PATTERNS)
+_CRYPTO_SPAM_RE = _compile_patterns(CRYPTO_SPAM_PATTERNS)
+
 # Logging setup
 logging.basicConfig(
     level=logging.INFO,
@@ -82,31 +156,90 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Reusable keep-alive session: avoids a fresh TCP + TLS handshake per request
+SESSION = requests.Session()
+SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (PolymarketBot/1.0)",
+    "Accept": "application/json",
+})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=HTTP_POOL_CONNECTIONS,
+    pool_maxsize=HTTP_POOL_MAXSIZE,
+    max_retries=HTTP_RETRIES,
+))
+
 
 # =============================================================================
 # STATE MANAGEMENT
 # =============================================================================
 
+def json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2) + "\n").encode()
+
+
 def load_state() -> dict:
-    """Load bot state from JSON file."""
+    """
+    Load bot state from JSON file.
+    Tweeted IDs are held as a bounded deque plus an in-memory set ("_tweeted_set")
+    for O(1) lookups; keys starting with "_" are not persisted.
+    """
+    state = None
     if STATE_FILE.exists():
         try:
-            with open(STATE_FILE, 'r') as f:
-                return json.load(f)
+            state = json_loads(STATE_FILE.read_bytes())
         except Exception as e:
             logger.warning(f"Could not load state: {e}")
+    if not isinstance(state, dict):
+        state = {
+            "tweeted_event_ids": [],
+            "total_tweets_sent": 0,
+            "last_poll_time": None
+        }
+    
+    tweeted_ids = deque(state.get("tweeted_event_ids") or [], maxlen=MAX_TWEETED_IDS)
+    state["tweeted_event_ids"] = tweeted_ids
+    state["_tweeted_set"] = set(tweeted_ids)
+    return state
+
+
+def mark_tweeted(state: dict, event_id: str):
+    """Record event_id as tweeted, evicting the oldest ID once the deque is full."""
+    tweeted_ids = state["tweeted_event_ids"]
+    tweeted_set = state["_tweeted_set"]
+    if len(tweeted_ids) == tweeted_ids.maxlen:
+        tweeted_set.discard(tweeted_ids.popleft())
+    tweeted_ids.append(event_id)
+    tweeted_set.add(event_id)
+
+
+def _serializable_state(state: dict) -> dict:
+    """Drop in-memory-only keys and convert deques to lists."""
     return {
-        "tweeted_event_ids": [],
-        "total_tweets_sent": 0,
-        "last_poll_time": None
+        key: list(value) if isinstance(value, deque) else value
+        for key, value in state.items()
+        if not key.startswith("_")
     }
 
 
 def save_state(state: dict):
-    """Save bot state to JSON file."""
+    """
+    Save bot state to JSON file.
+    Writes atomically (temp file + rename) so a crash mid-write can't corrupt it.
+    """
     try:
-        with open(STATE_FILE, 'w') as f:
-            json.dump(state, f, indent=2)
+        tmp_file = STATE_FILE.with_suffix(".tmp")
+        tmp_file.write_bytes(json_dumps(_serializable_state(state)))
+        os.replace(tmp_file, STATE_FILE)
     except Exception as e:
         logger.error(f"Could not save state: {e}")
 
@@ -115,10 +248,19 @@ def save_state(state: dict):
 # GAMMA API - EVENTS
 # =============================================================================
 
+# Last successfully parsed Gamma response and its validators.
+# In memory only, so a restart always does a full fetch.
+_events_cache: Dict = {"events": None, "etag": None, "last_modified": None}
+
+
 def fetch_recent_events(lookback_minutes: int = LOOKBACK_MINUTES) -> List[Dict]:
     """
     Fetch latest open events from /events endpoint.
     No time filtering - we track tweeted events in state instead.
+    The response is stream-parsed when ijson is available.
+    Sends a conditional GET with the ETag / Last-Modified of the last parsed
+    response; on 304 Not Modified the cached events are reused, since they may
+    still hold candidates that weren't tweeted yet.
     """
     params = {
         "limit": 200,  # Get more events to catch recent quality ones
@@ -127,19 +269,45 @@ def fetch_recent_events(lookback_minutes: int = LOOKBACK_MINUTES) -> List[Dict]:
         "closed": "false",
     }
     
-    url = f"{GAMMA_API_BASE}/events?{urllib.parse.urlencode(params)}"
+    url = f"{GAMMA_API_BASE}/events"
+    
+    headers = {}
+    if _events_cache["events"] is not None:
+        if _events_cache["etag"]:
+            headers["If-None-Match"] = _events_cache["etag"]
+        if _events_cache["last_modified"]:
+            headers["If-Modified-Since"] = _events_cache["last_modified"]
     
     try:
-        req = urllib.request.Request(url)
-        req.add_header("User-Agent", "Mozilla/5.0 (PolymarketBot/1.0)")
-        req.add_header("Accept", "application/json")
-        
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            events = json.loads(resp.read().decode())
-            if not isinstance(events, list):
-                return []
-            return events
+        with SESSION.get(url, params=params, headers=headers, timeout=GAMMA_TIMEOUT,
+                         stream=IJSON_AVAILABLE) as resp:
+            if resp.status_code == 304:
+                logger.info("Events unchanged since last poll (304), reusing cached events")
+                return list(_events_cache["events"] or [])
+            resp.raise_for_status()
+            
+            if IJSON_AVAILABLE:
+                resp.raw.decode_content = True
+                events = ijson.items(resp.raw, "item", use_float=True)
+            else:
+                events = json_loads(resp.content)
+                if not isinstance(events, list):
+                    return []
             
+            events = list(events)
+            
+            if IJSON_AVAILABLE:
+                # ijson stops at the closing bracket; read any trailing bytes
+                # so the connection goes back to the keep-alive pool (closing
+                # a partly read response would drop the socket)
+                resp.raw.drain_conn()
+            
+            # Only remember the validators once the body parsed cleanly
+            _events_cache["events"] = events
+            _events_cache["etag"] = resp.headers.get("ETag")
+            _events_cache["last_modified"] = resp.headers.get("Last-Modified")
+            return events
+        
     except Exception as e:
         logger.error(f"Gamma API error: {e}")
         return []
@@ -149,48 +317,20 @@ def fetch_recent_events(lookback_minutes: int = LOOKBACK_MINUTES) -> List[Dict]:
 # FILTERS
 # =============================================================================
 
-def is_sports_event(event: Dict) -> bool:
-    """Check if event is sports-related."""
+def is_sports_event(title_lc: str, series_lc: List[str]) -> bool:
+    """Check if event is sports-related, given its lowercased title and series slugs."""
     # Check series
-    series = event.get("series", [])
-    for s in series:
-        slug = (s.get("slug") or "").lower()
-        if slug in SPORTS_SERIES:
-            return True
-        # Also check for common sports patterns
-        if any(x in slug for x in ["nba", "nfl", "nhl", "mlb", "soccer", "football", "basketball"]):
+    for slug in series_lc:
+        if slug in SPORTS_SERIES or _SPORTS_SERIES_RE.search(slug):
             return True
     
     # Check title patterns
-    title = (event.get("title") or "").lower()
-    sports_patterns = [" vs ", " vs. ", "o/u ", "spread:", "moneyline", "over/under"]
-    if any(p in title for p in sports_patterns):
-        return True
-    
-    return False
+    return _SPORTS_TITLE_RE.search(title_lc) is not None
 
 
-def is_crypto_spam(event: Dict) -> bool:
-    """Check if event is crypto price prediction spam."""
-    title = (event.get("title") or "").lower()
-    
-    # Common crypto spam patterns
-    crypto_patterns = [
-        "up or down",
-        "bitcoin above", "bitcoin price", "bitcoin hit",
-        "ethereum above", "ethereum price", "ethereum hit",
-        "solana above", "solana price", "solana hit",
-        "xrp above", "xrp price", "xrp hit",
-        "doge above", "doge price", "doge hit",
-        "btc above", "btc price", "eth above", "eth price",
-        "sol above", "sol price",
-    ]
-    
-    for pattern in crypto_patterns:
-        if pattern in title:
-            return True
-    
-    return False
+def is_crypto_spam(title_lc: str) -> bool:
+    """Check if event is crypto price prediction spam, given its lowercased title."""
+    return _CRYPTO_SPAM_RE.search(title_lc) is not None
 
 
 def is_expired(event: Dict) -> bool:
@@ -204,70 +344,78 @@ def is_expired(event: Dict) -> bool:
     return False
 
 
-def filter_events(events: List[Dict], state: dict) -> List[Dict]:
+def filter_events(events: List[Dict], tweeted_ids: Set[str]) -> List[Dict]:
     """
     Filter events to quality ones only.
     Excludes: sports, crypto spam, expired, already tweeted.
     """
-    tweeted_ids = set(state.get("tweeted_event_ids", []))
-    
     filtered = []
     for event in events:
         event_id = str(event.get("id", ""))
         
         # Skip already tweeted
         if event_id in tweeted_ids:
-            logger.debug(f"Skipping already tweeted: {event_id}")
+            logger.debug("Skipping already tweeted: %s", event_id)
             continue
         
+        # Lowercase once for all text predicates
+        title_lc = (event.get("title") or "").lower()
+        series_lc = [(s.get("slug") or "").lower() for s in event.get("series") or []]
+        
         # Skip sports
-        if is_sports_event(event):
-            logger.debug(f"Skipping sports: {event.get('title', '')[:40]}")
+        if is_sports_event(title_lc, series_lc):
+            logger.debug("Skipping sports: %.40s", event.get("title", ""))
             continue
         
         # Skip crypto spam
-        if is_crypto_spam(event):
-            logger.debug(f"Skipping crypto spam: {event.get('title', '')[:40]}")
+        if is_crypto_spam(title_lc):
+            logger.debug("Skipping crypto spam: %.40s", event.get("title", ""))
             continue
         
         # Skip expired
         if is_expired(event):
-            logger.debug(f"Skipping expired: {event.get('title', '')[:40]}")
+            logger.debug("Skipping expired: %.40s", event.get("title", ""))
             continue
         
         # Check volume threshold
         volume = float(event.get("volume", 0) or 0)
         if volume < MIN_VOLUME:
-            logger.debug(f"Skipping low volume: {event.get('title', '')[:40]}")
+            logger.debug("Skipping low volume: %.40s", event.get("title", ""))
             continue
         
+        # Parsed volume, reused by find_best_event
+        event["_vol"] = volume
         filtered.append(event)
     
     return filtered
 
 
 def find_best_event(events: List[Dict]) -> Optional[Dict]:
-    """Find event with highest volume."""
+    """Find event with highest volume (events must come from filter_events)."""
     if not events:
         return None
     
-    # Sort by volume descending
-    events.sort(key=lambda e: float(e.get("volume", 0) or 0), reverse=True)
-    return events[0]
+    return max(events, key=itemgetter("_vol"))
 
 
 # =============================================================================
 # TWEET FORMATTING
 # =============================================================================
 
+# (threshold, divisor, formatter) for format_number, largest first
+_NUMBER_UNITS = (
+    (1_000_000, 1_000_000, "${:.1f}M".format),
+    (1_000, 1_000, "${:.0f}K".format),
+)
+_format_plain_number = "${:.0f}".format
+
+
 def format_number(num: float) -> str:
     """Format number with K/M suffix."""
-    if num >= 1_000_000:
-        return f"${num/1_000_000:.1f}M"
-    elif num >= 1_000:
-        return f"${num/1_000:.0f}K"
-    else:
-        return f"${num:.0f}"
+    for threshold, divisor, fmt in _NUMBER_UNITS:
+        if num >= threshold:
+            return fmt(num / divisor)
+    return _format_plain_number(num)
 
 
 def format_tweet(event: Dict) -> str:
@@ -276,13 +424,19 @@ def format_tweet(event: Dict) -> str:
     Max 280 characters.
     """
     title = event.get("title") or "New Event"
-    slug = event.get("slug") or event.get("id")
-    url = f"https://polymarket.com/event/{slug}"
+    slug = str(event.get("slug") or event.get("id"))
     
     # Get financial info
     volume = float(event.get("volume", 0) or 0)
     liquidity = float(event.get("liquidity", 0) or 0)
     
+    return _format_tweet_cached(title, slug, volume, liquidity)
+
+
+@lru_cache(maxsize=128)
+def _format_tweet_cached(title: str, slug: str, volume: float, liquidity: float) -> str:
+    """Build the tweet text from hashable fields (memoized across retries)."""
+    url = f"https://polymarket.com/event/{slug}"
     vol_str = format_number(volume)
     liq_str = format_number(liquidity)
     
@@ -326,16 +480,30 @@ def get_event_image_url(event: Dict) -> Optional[str]:
     return None
 
 
+# LRU of url -> image bytes; failed and oversized downloads are never stored
+_image_cache: 'OrderedDict[str, bytes]' = OrderedDict()
+
+
 def download_image(url: str) -> Optional[bytes]:
-    """Download image from URL."""
+    """Download image from URL, reusing a cached copy when available."""
+    cached = _image_cache.get(url)
+    if cached is not None:
+        _image_cache.move_to_end(url)
+        return cached
+    
     try:
-        req = urllib.request.Request(url)
-        req.add_header("User-Agent", "Mozilla/5.0")
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            return resp.read()
+        resp = SESSION.get(url, headers={"Accept": "image/*"}, timeout=IMAGE_TIMEOUT)
+        resp.raise_for_status()
+        data = resp.content
     except Exception as e:
         logger.warning(f"Could not download image: {e}")
         return None
+    
+    if len(data) < IMAGE_CACHE_MAX_BYTES:
+        _image_cache[url] = data
+        if len(_image_cache) > IMAGE_CACHE_SIZE:
+            _image_cache.popitem(last=False)
+    return data
 
 
 # =============================================================================
@@ -388,16 +556,17 @@ def upload_image(v1_api: 'tweepy.API', image_data: bytes) -> Optional[str]:
         return None
     
     try:
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            f.write(image_data)
-            temp_path = f.name
-        
-        # Upload
-        media = v1_api.media_upload(filename=temp_path)
-        
-        # Cleanup
-        Path(temp_path).unlink(missing_ok=True)
+        # Upload straight from memory (filename is only used for the media type).
+        # Large images go through the chunked upload; small ones fit a single POST.
+        if len(image_data) >= CHUNKED_UPLOAD_MIN_BYTES:
+            media = v1_api.media_upload(
+                filename="event.png",
+                file=BytesIO(image_data),
+                chunked=True,
+                media_category="tweet_image",
+            )
+        else:
+            media = v1_api.media_upload(filename="event.png", file=BytesIO(image_data))
         
         logger.info(f"📷 Image uploaded, media_id: {media.media_id}")
         return str(media.media_id)
@@ -407,9 +576,45 @@ def upload_image(v1_api: 'tweepy.API', image_data: bytes) -> Optional[str]:
         return None
 
 
+def tweet_quota_available(state: dict, now_ts: float) -> bool:
+    """
+    Refill the posting token bucket for the time elapsed since the last check
+    and return True if a tweet can be sent now.
+    Bucket state lives in "tweet_tokens", "tweet_tokens_updated_at" and
+    "rate_limit_reset" (epoch seconds) so it survives restarts.
+    """
+    reset_ts = state.get("rate_limit_reset")
+    if reset_ts and now_ts < reset_ts:
+        return False
+    
+    tokens = state.get("tweet_tokens", TWEET_QUOTA)
+    updated_at = state.get("tweet_tokens_updated_at") or now_ts
+    refill = (now_ts - updated_at) * TWEET_QUOTA / TWEET_QUOTA_WINDOW_SECONDS
+    tokens = min(TWEET_QUOTA, tokens + refill)
+    
+    # Twitter's limit has reset, so allow at least one tweet right away
+    if reset_ts:
+        state.pop("rate_limit_reset")
+        tokens = max(tokens, 1)
+    
+    state["tweet_tokens"] = tokens
+    state["tweet_tokens_updated_at"] = now_ts
+    return tokens >= 1
+
+
+def _rate_limit_reset(error: 'tweepy.TooManyRequests') -> datetime:
+    """Get the time the rate limit resets at from a 429 response."""
+    try:
+        reset_ts = float(error.response.headers["x-rate-limit-reset"])
+        return datetime.fromtimestamp(reset_ts, timezone.utc)
+    except (AttributeError, KeyError, TypeError, ValueError, OverflowError, OSError):
+        return datetime.now(timezone.utc) + timedelta(seconds=RATE_LIMIT_FALLBACK_SECONDS)
+
+
 def send_tweet_with_image(
     v2_client: 'tweepy.Client',
     v1_api: Optional['tweepy.API'],
+    state: dict,
     text: str,
     image_url: Optional[str] = None
 ) -> bool:
@@ -438,11 +643,15 @@ def send_tweet_with_image(
         
         tweet_id = response.data.get('id') if response.data else 'unknown'
         logger.info(f"✅ Tweet sent! ID: {tweet_id}")
+        state["tweet_tokens"] = state.get("tweet_tokens", TWEET_QUOTA) - 1
         return True
         
-    except tweepy.TooManyRequests:
-        logger.warning("Rate limited! Waiting 15 minutes...")
-        time.sleep(15 * 60)
+    except tweepy.TooManyRequests as e:
+        # Don't block the loop; skip tweeting until the limit resets
+        reset_at = _rate_limit_reset(e)
+        state["rate_limit_reset"] = reset_at.timestamp()
+        state["tweet_tokens"] = 0
+        logger.warning(f"Rate limited! Pausing tweets until {reset_at.isoformat()}")
         return False
     except tweepy.TwitterServerError as e:
         logger.error(f"Twitter server error: {e}")
@@ -456,35 +665,31 @@ def send_tweet_with_image(
 # MAIN BOT LOOP
 # =============================================================================
 
-def run_once(
+def tweet_best_event(
     v2_client: Optional['tweepy.Client'],
     v1_api: Optional['tweepy.API'],
-    state: dict
-) -> dict:
-    """
-    Single polling iteration.
-    Fetches latest events, tweets the best untweeted quality one with image.
-    """
-    logger.info(f"🔍 Polling for new quality events...")
+    state: dict,
+    now: datetime
+):
+    """Fetch latest events and tweet the best untweeted quality one with image."""
+    if v2_client and not tweet_quota_available(state, now.timestamp()):
+        logger.info("Tweet quota exhausted, skipping this poll")
+        return
     
     # Fetch latest events (no time filter - we track tweeted IDs)
     events = fetch_recent_events()
     if not events:
         logger.info("No events from API")
-        state["last_poll_time"] = datetime.now(timezone.utc).isoformat()
-        save_state(state)
-        return state
+        return
     
     logger.info(f"Fetched {len(events)} events from API")
     
     # Filter to quality events
-    quality_events = filter_events(events, state)
+    quality_events = filter_events(events, state["_tweeted_set"])
     
     if not quality_events:
         logger.info("No quality events after filtering")
-        state["last_poll_time"] = datetime.now(timezone.utc).isoformat()
-        save_state(state)
-        return state
+        return
     
     logger.info(f"🆕 {len(quality_events)} quality event(s) found!")
     
@@ -493,11 +698,11 @@ def run_once(
     
     if not best_event:
         logger.info("No event selected")
-        return state
+        return
     
     event_id = str(best_event.get("id", ""))
     title = best_event.get("title", "")[:50]
-    volume = float(best_event.get("volume", 0) or 0)
+    volume = best_event["_vol"]
     
     logger.info(f"🏆 Best event: {title}... (Vol: ${volume:,.0f})")
     
@@ -508,18 +713,30 @@ def run_once(
     
     # Tweet it with image
     tweet_text = format_tweet(best_event)
-    success = send_tweet_with_image(v2_client, v1_api, tweet_text, image_url)
+    success = send_tweet_with_image(v2_client, v1_api, state, tweet_text, image_url)
     
     if success:
-        # Mark as tweeted
-        tweeted_ids = state.get("tweeted_event_ids", [])
-        tweeted_ids.append(event_id)
-        # Keep only last 500 IDs
-        state["tweeted_event_ids"] = tweeted_ids[-500:]
+        # Mark as tweeted (only the last MAX_TWEETED_IDS are kept)
+        mark_tweeted(state, event_id)
         state["total_tweets_sent"] = state.get("total_tweets_sent", 0) + 1
-        save_state(state)
+
+
+def run_once(
+    v2_client: Optional['tweepy.Client'],
+    v1_api: Optional['tweepy.API'],
+    state: dict
+) -> dict:
+    """
+    Single polling iteration.
+    Tweets the best new event, then saves state once for the whole cycle.
+    """
+    logger.info(f"🔍 Polling for new quality events...")
+    
+    # Single clock read shared by everything in this cycle
+    now = datetime.now(timezone.utc)
+    tweet_best_event(v2_client, v1_api, state, now)
     
-    state["last_poll_time"] = datetime.now(timezone.utc).isoformat()
+    state["last_poll_time"] = now.isoformat()
     save_state(state)
     
     return state
@@ -556,13 +773,17 @@ def main():
     
     try:
         while True:
+            # Schedule against a fixed deadline so time spent fetching and
+            # uploading doesn't push every following poll later
+            next_poll = time.monotonic() + POLL_INTERVAL_SECONDS
             try:
                 state = run_once(v2_client, v1_api, state)
             except Exception as e:
                 logger.error(f"Error in poll cycle: {e}")
             
-            logger.info(f"💤 Sleeping {POLL_INTERVAL_SECONDS}s ({POLL_INTERVAL_SECONDS//60} min)...")
-            time.sleep(POLL_INTERVAL_SECONDS)
+            sleep_seconds = max(0.0, next_poll - time.monotonic())
+            logger.info(f"💤 Sleeping {sleep_seconds:.0f}s until next poll...")
+            time.sleep(sleep_seconds)
             
     except KeyboardInterrupt:
         logger.info("\n👋 Bot stopped by user")